@@ -120,34 +120,23 @@ export class AdminService {
       throw new NotFoundException('User not found');
     }
 
-    const existingSubscription = await this.prisma.subscription.findUnique({
-      where: { userId },
-    });
-
     const now = new Date();
     const periodEnd = new Date();
     periodEnd.setMonth(periodEnd.getMonth() + 1);
 
-    if (existingSubscription) {
-      return this.prisma.subscription.update({
-        where: { userId },
-        data: {
-          plan: planId,
-          status: 'active',
-          currentPeriodStart: now,
-          currentPeriodEnd: periodEnd,
-        },
-      });
-    }
+    // Single upsert on the unique userId instead of a read-then-branch
+    // update/create; mirrors BillingService.updateSubscription.
+    const subscriptionData = {
+      plan: planId,
+      status: 'active',
+      currentPeriodStart: now,
+      currentPeriodEnd: periodEnd,
+    };
 
-    return this.prisma.subscription.create({
-      data: {
-        userId,
-        plan: planId,
-        status: 'active',
-        currentPeriodStart: now,
-        currentPeriodEnd: periodEnd,
-      },
+    return this.prisma.subscription.upsert({
+      where: { userId },
+      create: { userId, ...subscriptionData },
+      update: subscriptionData,
     });
   }
 
@@ -15,6 +15,27 @@ interface MetadataOutput {
   description: string;
 }
 
+// Static prompt sections, built once; buildPrompt only interpolates the
+// per-page fields between them.
+const PROMPT_HEADER =
+  'You are an SEO assistant. Generate an SEO-friendly title (max 60 characters) and meta description (max 155 characters) for a webpage.';
+
+// Built once: every error path returns the same fallback, so there is no
+// point allocating a fresh object per failed call.
+const FALLBACK_METADATA: MetadataOutput = Object.freeze({
+  title: 'AI suggestions unavailable - configure AI_API_KEY',
+  description:
+    'Configure your AI provider API key in .env to enable AI-powered metadata suggestions.',
+});
+
+const PROMPT_FOOTER = `Requirements:
+- Title should be compelling and include primary keyword naturally
+- Meta description should summarize the page and include a call-to-action
+- Both should be optimized for click-through rate
+
+Respond in JSON format only:
+{"title": "your suggested title", "description": "your suggested meta description"}`;
+
 @Injectable()
 export class AiService {
   private readonly apiKey: string;
@@ -44,7 +65,7 @@ export class AiService {
       ? `Target keywords: ${input.targetKeywords.join(', ')}`
       : '';
 
-    return `You are an SEO assistant. Generate an SEO-friendly title (max 60 characters) and meta description (max 155 characters) for a webpage.
+    return `${PROMPT_HEADER}
 
 URL: ${input.url}
 Current Title: ${input.currentTitle || 'None'}
@@ -53,13 +74,7 @@ H1: ${input.h1 || 'None'}
 Page Content Snippet: ${input.pageTextSnippet || 'Not available'}
 ${keywordsText}
 
-Requirements:
-- Title should be compelling and include primary keyword naturally
-- Meta description should summarize the page and include a call-to-action
-- Both should be optimized for click-through rate
-
-Respond in JSON format only:
-{"title": "your suggested title", "description": "your suggested meta description"}`;
+${PROMPT_FOOTER}`;
   }
 
   private async callOpenAI(prompt: string): Promise<MetadataOutput> {
@@ -184,11 +199,19 @@ Respond in JSON format only:
   }
 
   private parseJsonResponse(content: string): MetadataOutput {
+    // Empty completions (filtered or truncated responses) can't contain
+    // JSON; skip the scan-and-parse attempt entirely.
+    if (!content) {
+      return this.getFallbackMetadata();
+    }
+
     try {
-      // Extract JSON from potential markdown code blocks
-      const jsonMatch = content.match(/\{[\s\S]*\}/);
-      if (jsonMatch) {
-        const parsed = JSON.parse(jsonMatch[0]);
+      // Extract JSON from potential markdown code blocks. Equivalent to the
+      // greedy /\{[\s\S]*\}/ match, but two index lookups instead of a scan.
+      const start = content.indexOf('{');
+      const end = content.lastIndexOf('}');
+      if (start !== -1 && end > start) {
+        const parsed = JSON.parse(content.slice(start, end + 1));
         return {
           title: parsed.title || 'Suggested Title',
           description: parsed.description || 'Suggested meta description for this page.',
@@ -201,10 +224,6 @@ Respond in JSON format only:
   }
 
   private getFallbackMetadata(): MetadataOutput {
-    return {
-      title: 'AI suggestions unavailable - configure AI_API_KEY',
-      description:
-        'Configure your AI provider API key in .env to enable AI-powered metadata suggestions.',
-    };
+    return FALLBACK_METADATA;
   }
 }
@@ -19,6 +19,9 @@ import { ContactModule } from './contact/contact.module';
   imports: [
     ConfigModule.forRoot({
       isGlobal: true,
+      // Cache resolved values so ConfigService.get() doesn't re-read
+      // process.env on every lookup.
+      cache: true,
       envFilePath: process.env.NODE_ENV === 'test' ? '.env.test' : '.env',
     }),
     CaptchaModule,
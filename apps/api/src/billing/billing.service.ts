@@ -2,6 +2,15 @@ import { Injectable, NotFoundException, BadRequestException } from '@nestjs/comm
 import { PrismaService } from '../prisma.service';
 import { PLANS, getPlanById, Plan } from './plans';
 
+// Shape returned for users with no Subscription row; built once since it
+// never varies per user.
+const DEFAULT_FREE_SUBSCRIPTION = Object.freeze({
+  plan: 'free',
+  status: 'active',
+  currentPeriodStart: null,
+  currentPeriodEnd: null,
+});
+
 @Injectable()
 export class BillingService {
   constructor(private readonly prisma: PrismaService) {}
@@ -9,7 +18,7 @@ export class BillingService {
   /**
    * Get all available plans
    */
-  getPlans(): Plan[] {
+  getPlans(): readonly Plan[] {
     return PLANS;
   }
 
@@ -23,12 +32,7 @@ export class BillingService {
 
     if (!subscription) {
       // Return a default "free" subscription for users without one
-      return {
-        plan: 'free',
-        status: 'active',
-        currentPeriodStart: null,
-        currentPeriodEnd: null,
-      };
+      return DEFAULT_FREE_SUBSCRIPTION;
     }
 
     return subscription;
@@ -56,34 +60,23 @@ export class BillingService {
     // TODO: Integrate with Stripe for payment processing
     // For now, just update the subscription in the database
 
-    const existingSubscription = await this.prisma.subscription.findUnique({
-      where: { userId },
-    });
-
     const now = new Date();
     const periodEnd = new Date();
     periodEnd.setMonth(periodEnd.getMonth() + 1);
 
-    if (existingSubscription) {
-      return this.prisma.subscription.update({
-        where: { userId },
-        data: {
-          plan: planId,
-          status: 'active',
-          currentPeriodStart: now,
-          currentPeriodEnd: periodEnd,
-        },
-      });
-    }
+    // Single upsert on the unique userId: one statement instead of a
+    // read-then-branch update/create, and no race between the two.
+    const subscriptionData = {
+      plan: planId,
+      status: 'active',
+      currentPeriodStart: now,
+      currentPeriodEnd: periodEnd,
+    };
 
-    return this.prisma.subscription.create({
-      data: {
-        userId,
-        plan: planId,
-        status: 'active',
-        currentPeriodStart: now,
-        currentPeriodEnd: periodEnd,
-      },
+    return this.prisma.subscription.upsert({
+      where: { userId },
+      create: { userId, ...subscriptionData },
+      update: subscriptionData,
     });
   }
 
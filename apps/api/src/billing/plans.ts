@@ -1,16 +1,18 @@
 export interface Plan {
-  id: string;
-  name: string;
-  price: number; // monthly price in cents
-  features: string[];
-  limits: {
-    projects: number;
-    scansPerMonth: number;
-    aiSuggestionsPerMonth: number;
+  readonly id: string;
+  readonly name: string;
+  readonly price: number; // monthly price in cents
+  readonly features: readonly string[];
+  readonly limits: {
+    readonly projects: number;
+    readonly scansPerMonth: number;
+    readonly aiSuggestionsPerMonth: number;
   };
 }
 
-export const PLANS: Plan[] = [
+// Frozen: the catalog is shared across every request and returned from
+// handlers, so nothing should be able to mutate it in place.
+export const PLANS: readonly Plan[] = Object.freeze([
   {
     id: 'free',
     name: 'Free',
@@ -81,8 +83,11 @@ export const PLANS: Plan[] = [
       aiSuggestionsPerMonth: -1,
     },
   },
-];
+]);
+
+// Index plans by id once so repeated lookups don't re-scan the list
+const PLANS_BY_ID = new Map(PLANS.map((p) => [p.id, p]));
 
 export function getPlanById(planId: string): Plan | undefined {
-  return PLANS.find((p) => p.id === planId);
+  return PLANS_BY_ID.get(planId);
 }
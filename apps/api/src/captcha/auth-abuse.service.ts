@@ -54,28 +54,35 @@ export class AuthAbuseService {
   }
 
   /**
-   * Check if CAPTCHA is required for an email based on failed attempts
-   * @param email The email attempting to login
-   * @returns true if CAPTCHA should be required
+   * Look up the tracked entry for an email, evicting it when its window
+   * has expired. Every read path shares this so the expiry rule is
+   * applied (and the map pruned) in exactly one place.
    */
-  isCaptchaRequired(email: string): boolean {
+  private getActiveEntry(email: string): FailedAttempt | null {
     const key = email.toLowerCase();
     const existing = this.failedAttempts.get(key);
 
     if (!existing) {
-      return false;
+      return null;
     }
 
-    // Check if window has expired
     const elapsed = (Date.now() - existing.firstAttempt) / 1000;
     if (elapsed >= this.windowSeconds) {
-      // Window expired, clear and don't require CAPTCHA
       this.failedAttempts.delete(key);
-      return false;
+      return null;
     }
 
-    // Require CAPTCHA if attempts exceed threshold
-    return existing.count >= this.threshold;
+    return existing;
+  }
+
+  /**
+   * Check if CAPTCHA is required for an email based on failed attempts
+   * @param email The email attempting to login
+   * @returns true if CAPTCHA should be required
+   */
+  isCaptchaRequired(email: string): boolean {
+    const existing = this.getActiveEntry(email);
+    return existing !== null && existing.count >= this.threshold;
   }
 
   /**
@@ -84,21 +91,7 @@ export class AuthAbuseService {
    * @returns The number of failed attempts in the current window
    */
   getFailureCount(email: string): number {
-    const key = email.toLowerCase();
-    const existing = this.failedAttempts.get(key);
-
-    if (!existing) {
-      return 0;
-    }
-
-    // Check if window has expired
-    const elapsed = (Date.now() - existing.firstAttempt) / 1000;
-    if (elapsed >= this.windowSeconds) {
-      this.failedAttempts.delete(key);
-      return 0;
-    }
-
-    return existing.count;
+    return this.getActiveEntry(email)?.count ?? 0;
   }
 
   /**
@@ -1,5 +1,9 @@
 // apps/api/src/config/redis.config.ts
 
+// Managed Redis hosts that require TLS; checked as domain suffixes so a
+// new provider is a one-line addition.
+const TLS_HOST_SUFFIXES = ['upstash.io', 'redis.cloud', 'redislabs.com'];
+
 function parseRedisUrl(url: string | undefined) {
   if (!url) return null;
 
@@ -12,10 +16,8 @@ function parseRedisUrl(url: string | undefined) {
 
     // Upstash and other cloud Redis providers require TLS
     const requiresTls =
-      host.includes('upstash.io') ||
-      host.includes('redis.cloud') ||
-      host.includes('redislabs.com') ||
-      url.startsWith('rediss://');
+      url.startsWith('rediss://') ||
+      TLS_HOST_SUFFIXES.some((suffix) => host.endsWith(suffix));
 
     return {
       host,
@@ -9,10 +9,16 @@ export class ContactController {
 
   @Post()
   async submit(@Body() dto: ContactDto, @Req() req: Request) {
-    // Get client IP for CAPTCHA verification
-    const clientIp =
-      (req.headers['x-forwarded-for'] as string)?.split(',')[0]?.trim() ||
-      req.socket.remoteAddress;
+    // Get client IP for CAPTCHA verification. Only the first hop of
+    // x-forwarded-for matters, so slice up to the first comma instead of
+    // splitting the whole header into an array.
+    const forwardedFor = req.headers['x-forwarded-for'] as string | undefined;
+    let clientIp = req.socket.remoteAddress;
+    if (forwardedFor) {
+      const comma = forwardedFor.indexOf(',');
+      const firstHop = (comma === -1 ? forwardedFor : forwardedFor.slice(0, comma)).trim();
+      clientIp = firstHop || clientIp;
+    }
 
     // Verify CAPTCHA first
     await this.captchaService.verify(dto.captchaToken, clientIp);
@@ -13,6 +13,28 @@ import {
 import { IntegrationsService, CreateIntegrationDto, UpdateIntegrationDto } from './integrations.service';
 import { IntegrationType } from '@prisma/client';
 
+// Built once at module load: O(1) membership for type validation, plus the
+// pre-joined list used in the error message.
+const VALID_INTEGRATION_TYPES = new Set<string>(Object.values(IntegrationType));
+const VALID_INTEGRATION_TYPES_LIST = Object.values(IntegrationType).join(', ');
+
+// Display metadata per type, built once rather than per request
+const INTEGRATION_LABELS: Record<IntegrationType, string> = {
+  [IntegrationType.SHOPIFY]: 'Shopify',
+  [IntegrationType.WOOCOMMERCE]: 'WooCommerce',
+  [IntegrationType.BIGCOMMERCE]: 'BigCommerce',
+  [IntegrationType.MAGENTO]: 'Magento',
+  [IntegrationType.CUSTOM_WEBSITE]: 'Custom Website',
+};
+
+const INTEGRATION_DESCRIPTIONS: Record<IntegrationType, string> = {
+  [IntegrationType.SHOPIFY]: 'Connect your Shopify store for product sync and SEO optimization',
+  [IntegrationType.WOOCOMMERCE]: 'Connect your WooCommerce store via REST API',
+  [IntegrationType.BIGCOMMERCE]: 'Connect your BigCommerce store for product management',
+  [IntegrationType.MAGENTO]: 'Connect your Magento 2 store via REST API',
+  [IntegrationType.CUSTOM_WEBSITE]: 'Connect any website for SEO scanning and analysis',
+};
+
 @Controller('integrations')
 export class IntegrationsController {
   constructor(private readonly integrationsService: IntegrationsService) {}
@@ -172,41 +194,19 @@ export class IntegrationsController {
     return {
       types: Object.values(IntegrationType).map((type) => ({
         value: type,
-        label: this.getIntegrationLabel(type),
-        description: this.getIntegrationDescription(type),
+        label: INTEGRATION_LABELS[type],
+        description: INTEGRATION_DESCRIPTIONS[type],
       })),
     };
   }
 
   private parseIntegrationType(type: string): IntegrationType {
     const upperType = type.toUpperCase();
-    if (!Object.values(IntegrationType).includes(upperType as IntegrationType)) {
+    if (!VALID_INTEGRATION_TYPES.has(upperType)) {
       throw new BadRequestException(
-        `Invalid integration type: ${type}. Valid types: ${Object.values(IntegrationType).join(', ')}`,
+        `Invalid integration type: ${type}. Valid types: ${VALID_INTEGRATION_TYPES_LIST}`,
       );
     }
     return upperType as IntegrationType;
   }
-
-  private getIntegrationLabel(type: IntegrationType): string {
-    const labels: Record<IntegrationType, string> = {
-      [IntegrationType.SHOPIFY]: 'Shopify',
-      [IntegrationType.WOOCOMMERCE]: 'WooCommerce',
-      [IntegrationType.BIGCOMMERCE]: 'BigCommerce',
-      [IntegrationType.MAGENTO]: 'Magento',
-      [IntegrationType.CUSTOM_WEBSITE]: 'Custom Website',
-    };
-    return labels[type];
-  }
-
-  private getIntegrationDescription(type: IntegrationType): string {
-    const descriptions: Record<IntegrationType, string> = {
-      [IntegrationType.SHOPIFY]: 'Connect your Shopify store for product sync and SEO optimization',
-      [IntegrationType.WOOCOMMERCE]: 'Connect your WooCommerce store via REST API',
-      [IntegrationType.BIGCOMMERCE]: 'Connect your BigCommerce store for product management',
-      [IntegrationType.MAGENTO]: 'Connect your Magento 2 store via REST API',
-      [IntegrationType.CUSTOM_WEBSITE]: 'Connect any website for SEO scanning and analysis',
-    };
-    return descriptions[type];
-  }
 }
@@ -20,9 +20,17 @@ export class DeoScoreService {
   async getLatestForProject(projectId: string, userId: string): Promise<DeoScoreLatestResponse> {
     const prisma = this.prisma as any;
 
-    const project = await prisma.project.findUnique({
-      where: { id: projectId },
-    });
+    // The ownership lookup and the latest-snapshot lookup are independent
+    // queries, so issue them concurrently and validate once both resolve.
+    const [project, snapshot] = await Promise.all([
+      prisma.project.findUnique({
+        where: { id: projectId },
+      }),
+      prisma.deoScoreSnapshot.findFirst({
+        where: { projectId },
+        orderBy: { computedAt: 'desc' },
+      }),
+    ]);
 
     if (!project) {
       throw new NotFoundException('Project not found');
@@ -32,11 +40,6 @@ export class DeoScoreService {
       throw new ForbiddenException('You do not have access to this project');
     }
 
-    const snapshot = await prisma.deoScoreSnapshot.findFirst({
-      where: { projectId },
-      orderBy: { computedAt: 'desc' },
-    });
-
     if (!snapshot) {
       return {
         projectId,
@@ -91,27 +94,31 @@ export class DeoScoreService {
     const breakdown = computeDeoScoreFromSignals(signals);
     const now = new Date();
 
-    const created = await prisma.deoScoreSnapshot.create({
-      data: {
-        projectId,
-        overallScore: breakdown.overall,
-        contentScore: breakdown.content ?? null,
-        entityScore: breakdown.entities ?? null,
-        technicalScore: breakdown.technical ?? null,
-        visibilityScore: breakdown.visibility ?? null,
-        version: DEO_SCORE_VERSION,
-        metadata: {},
-        computedAt: now,
-      },
-    });
-
-    await prisma.project.update({
-      where: { id: projectId },
-      data: {
-        currentDeoScore: breakdown.overall,
-        currentDeoScoreComputedAt: now,
-      },
-    });
+    // Persist the snapshot and the project's denormalized score in one
+    // batched transaction: a single database round trip, and the two rows
+    // can never disagree if the worker dies between writes.
+    const [created] = await prisma.$transaction([
+      prisma.deoScoreSnapshot.create({
+        data: {
+          projectId,
+          overallScore: breakdown.overall,
+          contentScore: breakdown.content ?? null,
+          entityScore: breakdown.entities ?? null,
+          technicalScore: breakdown.technical ?? null,
+          visibilityScore: breakdown.visibility ?? null,
+          version: DEO_SCORE_VERSION,
+          metadata: {},
+          computedAt: now,
+        },
+      }),
+      prisma.project.update({
+        where: { id: projectId },
+        data: {
+          currentDeoScore: breakdown.overall,
+          currentDeoScoreComputedAt: now,
+        },
+      }),
+    ]);
 
     return {
       id: created.id,
@@ -130,6 +137,17 @@ export class DeoScoreService {
  * Phase 2.3: Uses heuristic, data-driven signals derived from existing DB tables
  * (CrawlResult, Product, Project) only. All signals are normalized in the 0–1 range.
  */
+// Compiled once at module load; matches each run of non-whitespace (a word)
+const WORD_RE = /\S+/g;
+
+// Brand-like homepage paths, partitioned into exact matches (O(1) set
+// lookup) and prefix matches so the per-crawl check stays cheap.
+const BRAND_EXACT_PATHS = new Set(['/', '/home']);
+const BRAND_PATH_PREFIXES = ['/about', '/contact', '/pricing', '/blog'];
+
+// Freshness window for content signals
+const NINETY_DAYS_MS = 90 * 24 * 60 * 60 * 1000;
+
 @Injectable()
 export class DeoSignalsService {
   constructor(private readonly prisma: PrismaService) {}
@@ -162,91 +180,42 @@ export class DeoSignalsService {
     const totalCrawls = crawlResults.length;
     const totalProducts = products.length;
 
-    // ---------- Content signals ----------
+    // All per-crawl and per-product accumulators are gathered in a single
+    // pass over each collection; every signal below reads from these sums
+    // instead of re-iterating the rows.
+    let coveredCrawls = 0;
+    let wordCountSum = 0;
+    let wordCountSamples = 0;
+    let freshnessSum = 0;
+    let successfulCrawls = 0;
+    let indexablePages = 0;
+    let pagesWithStructuralIssues = 0;
+    let answerReadyPages = 0;
+    let pagesWithSeoMetadata = 0;
+    let crawlEntityHints = 0;
+    let brandPages = 0;
 
-    // contentCoverage: % of pages/products with both title and description-like fields
-    const totalItemsForContent = totalCrawls + totalProducts;
-    let coveredItems = 0;
+    const now = Date.now();
 
     for (const cr of crawlResults) {
       if (cr.title && cr.metaDescription) {
-        coveredItems++;
-      }
-    }
-
-    for (const product of products) {
-      const titleSource = product.seoTitle ?? product.title;
-      const descriptionSource = product.seoDescription ?? product.description;
-      if (titleSource && descriptionSource) {
-        coveredItems++;
+        // Counts toward both contentCoverage and serpPresence.
+        coveredCrawls++;
+        pagesWithSeoMetadata++;
       }
-    }
-
-    const contentCoverage =
-      totalItemsForContent > 0 ? coveredItems / totalItemsForContent : 0;
-
-    // contentDepth: average word count across pages and product descriptions, normalized to 800 words
-    const wordCounts: number[] = [];
 
-    for (const cr of crawlResults) {
       if (typeof cr.wordCount === 'number') {
-        wordCounts.push(cr.wordCount);
-      }
-    }
-
-    for (const product of products) {
-      if (product.description) {
-        const count = product.description
-          .trim()
-          .split(/\s+/)
-          .filter(Boolean).length;
-        wordCounts.push(count);
+        wordCountSum += cr.wordCount;
+        wordCountSamples++;
       }
-    }
-
-    const avgWordCount =
-      wordCounts.length > 0
-        ? wordCounts.reduce((sum: number, value: number) => sum + value, 0) / wordCounts.length
-        : 0;
-
-    const contentDepth = Math.max(0, Math.min(1, avgWordCount / 800));
 
-    // contentFreshness: average of 1 - age/90d across crawlResults.scannedAt and products.lastSyncedAt
-    const freshnessScores: number[] = [];
-    const now = Date.now();
-    const ninetyDaysMs = 90 * 24 * 60 * 60 * 1000;
-
-    for (const cr of crawlResults) {
       const ageMs = now - cr.scannedAt.getTime();
-      const ageRatio = Math.min(ageMs / ninetyDaysMs, 1);
-      freshnessScores.push(1 - ageRatio);
-    }
+      freshnessSum += 1 - Math.min(ageMs / NINETY_DAYS_MS, 1);
 
-    for (const product of products) {
-      const ageMs = now - product.lastSyncedAt.getTime();
-      const ageRatio = Math.min(ageMs / ninetyDaysMs, 1);
-      freshnessScores.push(1 - ageRatio);
-    }
-
-    const contentFreshness =
-      freshnessScores.length > 0
-        ? freshnessScores.reduce((sum: number, value: number) => sum + value, 0) /
-          freshnessScores.length
-        : 0;
-
-    // ---------- Technical & visibility helpers ----------
-
-    let successfulCrawls = 0;
-    let indexablePages = 0;
-    let pagesWithStructuralIssues = 0;
-    let answerReadyPages = 0;
-    let pagesWithSeoMetadata = 0;
-    let productsWithSeoMetadata = 0;
-
-    for (const cr of crawlResults) {
-      const issues = (cr.issues as string[]) ?? [];
-      const hasHttpError =
-        issues.includes('HTTP_ERROR') || issues.includes('FETCH_ERROR');
+      // Issue codes are checked several times below; a Set makes each
+      // membership test O(1) instead of re-scanning the array.
+      const issues = new Set((cr.issues as string[]) ?? []);
+      const hasHttpError = issues.has('HTTP_ERROR') || issues.has('FETCH_ERROR');
 
       const isSuccess =
         cr.statusCode >= 200 && cr.statusCode < 400 && !hasHttpError;
@@ -255,7 +224,7 @@ export class DeoSignalsService {
         successfulCrawls++;
       }
 
-      const hasThinContent = issues.includes('THIN_CONTENT');
+      const hasThinContent = issues.has('THIN_CONTENT');
       const isIndexable = isSuccess && !hasThinContent;
 
       if (isIndexable) {
@@ -263,9 +232,9 @@ export class DeoSignalsService {
       }
 
       const hasStructuralIssues =
-        issues.includes('MISSING_TITLE') ||
-        issues.includes('MISSING_META_DESCRIPTION') ||
-        issues.includes('MISSING_H1') ||
+        issues.has('MISSING_TITLE') ||
+        issues.has('MISSING_META_DESCRIPTION') ||
+        issues.has('MISSING_H1') ||
         hasThinContent;
 
       if (hasStructuralIssues) {
@@ -276,19 +245,70 @@ export class DeoSignalsService {
         answerReadyPages++;
       }
 
-      if (cr.title && cr.metaDescription) {
-        pagesWithSeoMetadata++;
+      if (cr.title && cr.h1) {
+        crawlEntityHints++;
+      }
+
+      // Brand-like page detection. Slice the path out and trim the query
+      // first, then lowercase only what's left — the scheme, host, and any
+      // query string never go through the case conversion.
+      const pathStart = cr.url.indexOf('/', cr.url.indexOf('://') + 3);
+      let path = pathStart === -1 ? '/' : cr.url.substring(pathStart);
+
+      const queryStart = path.indexOf('?');
+      if (queryStart !== -1) {
+        path = path.slice(0, queryStart);
+      }
+      const lowerPath = path.toLowerCase();
+      if (
+        BRAND_EXACT_PATHS.has(lowerPath) ||
+        BRAND_PATH_PREFIXES.some((prefix) => lowerPath.startsWith(prefix))
+      ) {
+        brandPages++;
       }
     }
 
+    // Every product-level signal uses the same "has title and description"
+    // predicate (SEO fields falling back to base fields); derive it in the
+    // same pass as the word-count and freshness sums.
+    let productsWithMetadata = 0;
+
     for (const product of products) {
       const titleSource = product.seoTitle ?? product.title;
       const descriptionSource = product.seoDescription ?? product.description;
       if (titleSource && descriptionSource) {
-        productsWithSeoMetadata++;
+        productsWithMetadata++;
+      }
+
+      if (product.description) {
+        // Single pass over the description, no intermediate token array
+        // survives beyond the match call.
+        wordCountSum += (product.description.match(WORD_RE) ?? []).length;
+        wordCountSamples++;
       }
+
+      const ageMs = now - product.lastSyncedAt.getTime();
+      freshnessSum += 1 - Math.min(ageMs / NINETY_DAYS_MS, 1);
     }
 
+    // ---------- Content signals ----------
+
+    // contentCoverage: % of pages/products with both title and description-like fields
+    const totalItemsForContent = totalCrawls + totalProducts;
+    const coveredItems = coveredCrawls + productsWithMetadata;
+
+    const contentCoverage =
+      totalItemsForContent > 0 ? coveredItems / totalItemsForContent : 0;
+
+    // contentDepth: average word count across pages and product descriptions, normalized to 800 words
+    const avgWordCount = wordCountSamples > 0 ? wordCountSum / wordCountSamples : 0;
+
+    const contentDepth = Math.max(0, Math.min(1, avgWordCount / 800));
+
+    // contentFreshness: average of 1 - age/90d across crawlResults.scannedAt and products.lastSyncedAt
+    const freshnessSamples = totalCrawls + totalProducts;
+    const contentFreshness = freshnessSamples > 0 ? freshnessSum / freshnessSamples : 0;
+
     // ---------- Technical signals ----------
 
     // crawlHealth: % of crawl results that returned successful HTTP status and no HTTP/FETCH_ERROR
@@ -305,21 +325,7 @@ export class DeoSignalsService {
     // ---------- Entity signals (proto) ----------
 
     const totalItemsForEntity = totalCrawls + totalProducts;
-    let entityHintCount = 0;
-
-    for (const cr of crawlResults) {
-      if (cr.title && cr.h1) {
-        entityHintCount++;
-      }
-    }
-
-    for (const product of products) {
-      const titleSource = product.seoTitle ?? product.title;
-      const descriptionSource = product.seoDescription ?? product.description;
-      if (titleSource && descriptionSource) {
-        entityHintCount++;
-      }
-    }
+    const entityHintCount = crawlEntityHints + productsWithMetadata;
 
     // entityCoverage: % of pages/products with "entity hints" (title + h1 or SEO title + description)
     const entityCoverage =
@@ -343,37 +349,14 @@ export class DeoSignalsService {
     const totalItemsForVisibility = totalCrawls + totalProducts;
     const serpPresence =
       totalItemsForVisibility > 0
-        ? (pagesWithSeoMetadata + productsWithSeoMetadata) /
+        ? (pagesWithSeoMetadata + productsWithMetadata) /
           totalItemsForVisibility
         : 0;
 
     // brandNavigationalStrength: normalized count of brand-like pages (/, /home, /about, /contact, /pricing, /blog)
-    let brandNavigationalStrength = 0;
-    if (totalCrawls > 0) {
-      let brandPages = 0;
-      for (const cr of crawlResults) {
-        const url = cr.url.toLowerCase();
-
-        const pathStart = url.indexOf('/', url.indexOf('://') + 3);
-        const path =
-          pathStart === -1 ? '/' : url.substring(pathStart).split('?')[0];
-
-        const lowerPath = path.toLowerCase();
-        if (
-          lowerPath === '/' ||
-          lowerPath === '/home' ||
-          lowerPath.startsWith('/about') ||
-          lowerPath.startsWith('/contact') ||
-          lowerPath.startsWith('/pricing') ||
-          lowerPath.startsWith('/blog')
-        ) {
-          brandPages++;
-        }
-      }
-
-      // Normalize: 0 brand pages → 0, 1–3 pages → up to 1, 3+ saturated at 1
-      brandNavigationalStrength = Math.min(1, brandPages / 3);
-    }
+    // Normalize: 0 brand pages → 0, 1–3 pages → up to 1, 3+ saturated at 1
+    const brandNavigationalStrength =
+      totalCrawls > 0 ? Math.min(1, brandPages / 3) : 0;
 
     // answerSurfacePresence: % of pages that look "answer-ready" (enough content + H1)
     const answerSurfacePresence =
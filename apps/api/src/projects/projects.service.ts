@@ -59,25 +59,17 @@ export class ProjectsService {
   async deleteProject(projectId: string, userId: string) {
     const project = await this.getProject(projectId, userId);
 
-    // Delete related integrations first
-    await this.prisma.integration.deleteMany({
-      where: { projectId },
-    });
-
-    // Delete related products
-    await this.prisma.product.deleteMany({
-      where: { projectId },
-    });
-
-    // Delete related crawl results
-    await this.prisma.crawlResult.deleteMany({
-      where: { projectId },
-    });
-
-    // Delete the project
-    return this.prisma.project.delete({
-      where: { id: projectId },
-    });
+    // Delete related rows and the project itself in one batched transaction:
+    // a single database round trip instead of four sequential awaits, and no
+    // half-deleted project if one statement fails.
+    const [, , , deleted] = await this.prisma.$transaction([
+      this.prisma.integration.deleteMany({ where: { projectId } }),
+      this.prisma.product.deleteMany({ where: { projectId } }),
+      this.prisma.crawlResult.deleteMany({ where: { projectId } }),
+      this.prisma.project.delete({ where: { id: projectId } }),
+    ]);
+
+    return deleted;
   }
 
   /**
@@ -227,11 +219,26 @@ export class ProjectsService {
       throw new ForbiddenException('You do not have access to this project');
     }
 
-    // Get crawl results for issue count and avg score calculation
-    const crawlResults = await this.prisma.crawlResult.findMany({
-      where: { projectId },
-      select: { issues: true },
-    });
+    // The crawl results and both product counts are independent; fetch them
+    // concurrently instead of three sequential awaits.
+    const [crawlResults, productCount, productsWithAppliedSeo] = await Promise.all([
+      this.prisma.crawlResult.findMany({
+        where: { projectId },
+        select: { issues: true },
+      }),
+      this.prisma.product.count({
+        where: { projectId },
+      }),
+      this.prisma.product.count({
+        where: {
+          projectId,
+          OR: [
+            { seoTitle: { not: null } },
+            { seoDescription: { not: null } },
+          ],
+        },
+      }),
+    ]);
 
     const crawlCount = crawlResults.length;
 
@@ -248,21 +255,6 @@ export class ProjectsService {
 
     const avgSeoScore = crawlCount > 0 ? Math.round(totalScore / crawlCount) : null;
 
-    // Get product counts
-    const productCount = await this.prisma.product.count({
-      where: { projectId },
-    });
-
-    const productsWithAppliedSeo = await this.prisma.product.count({
-      where: {
-        projectId,
-        OR: [
-          { seoTitle: { not: null } },
-          { seoDescription: { not: null } },
-        ],
-      },
-    });
-
     return {
       crawlCount,
       issueCount,
@@ -6,8 +6,8 @@
  *   Intended to be run as a Render cron job (e.g., daily at 2 AM UTC).
  *
  * Status:
- *   This is currently a SKELETON implementation. The pg_dump execution
- *   and S3 upload logic are stubbed with TODO comments.
+ *   pg_dump execution is implemented (streamed to a gzipped file in /tmp).
+ *   The S3 upload step is still stubbed with TODO comments.
  *
  * Required Environment Variables:
  *   - DATABASE_URL: Neon PostgreSQL connection string
@@ -22,6 +22,14 @@
  * @see docs/DEPLOYMENT.md for full setup instructions
  */
 
+import { spawn } from 'child_process';
+import * as fs from 'fs';
+import * as zlib from 'zlib';
+
+// Hard ceiling for the pg_dump step; a wedged dump (e.g., network hang to
+// Neon) should fail the cron run instead of blocking it forever.
+const PG_DUMP_TIMEOUT_MS = 15 * 60 * 1000;
+
 // Required environment variables for backup
 const REQUIRED_ENV_VARS = [
   'DATABASE_URL',
@@ -31,11 +39,19 @@ const REQUIRED_ENV_VARS = [
   'S3_BACKUP_BUCKET',
 ] as const;
 
+interface BackupConfig {
+  databaseUrl: string;
+  awsRegion: string;
+  s3Bucket: string;
+}
+
 /**
- * Validates that all required environment variables are present.
+ * Validates that all required environment variables are present and
+ * snapshots the ones the backup uses into one config object, so the rest
+ * of the run never reads process.env again.
  * Exits with code 1 if any are missing.
  */
-function validateEnvironment(): void {
+function loadBackupConfig(): BackupConfig {
   const missing: string[] = [];
 
   for (const envVar of REQUIRED_ENV_VARS) {
@@ -52,15 +68,30 @@ function validateEnvironment(): void {
   }
 
   console.log('[backup-db] Environment validation passed.');
+
+  return {
+    databaseUrl: process.env.DATABASE_URL as string,
+    awsRegion: process.env.AWS_REGION as string,
+    s3Bucket: process.env.S3_BACKUP_BUCKET as string,
+  };
 }
 
 /**
  * Generates a timestamped backup filename.
  * Format: seoengine-backup-YYYYMMDD-HHmmss.sql
  */
-function generateBackupFilename(): string {
-  const now = new Date();
-  const timestamp = now.toISOString().replace(/[-:]/g, '').replace('T', '-').split('.')[0];
+function generateBackupFilename(now: Date): string {
+  // ISO timestamps are fixed-width (2026-08-30T12:34:56.789Z), so the
+  // YYYYMMDD-HHmmss form falls out of plain slices; no regex passes needed.
+  const iso = now.toISOString();
+  const timestamp =
+    iso.slice(0, 4) +
+    iso.slice(5, 7) +
+    iso.slice(8, 10) +
+    '-' +
+    iso.slice(11, 13) +
+    iso.slice(14, 16) +
+    iso.slice(17, 19);
   return `seoengine-backup-${timestamp}.sql`;
 }
 
@@ -68,8 +99,7 @@ function generateBackupFilename(): string {
  * Generates the S3 key (path) for the backup file.
  * Format: backups/YYYY/MM/DD/<filename>
  */
-function generateS3Key(filename: string): string {
-  const now = new Date();
+function generateS3Key(filename: string, now: Date): string {
   const year = now.getUTCFullYear();
   const month = String(now.getUTCMonth() + 1).padStart(2, '0');
   const day = String(now.getUTCDate()).padStart(2, '0');
@@ -90,54 +120,110 @@ function sanitizeDatabaseUrl(url: string): string {
 }
 
 /**
- * Executes pg_dump to create a database backup.
- * TODO: Implement actual pg_dump execution.
+ * Splits DATABASE_URL into the discrete PG* environment variables libpq
+ * reads. libpq only expands a full connection URI when it is passed as a
+ * connection parameter (argv -d/positional); environment variables like
+ * PGDATABASE are taken as literal values, so the URL must be decomposed
+ * before it goes into the spawn env.
+ */
+function pgEnvFromDatabaseUrl(databaseUrl: string): Record<string, string> {
+  const url = new URL(databaseUrl);
+
+  const env: Record<string, string> = {
+    PGHOST: url.hostname,
+    PGDATABASE: decodeURIComponent(url.pathname.slice(1)),
+    PGUSER: decodeURIComponent(url.username),
+    PGPASSWORD: decodeURIComponent(url.password),
+  };
+
+  if (url.port) {
+    env.PGPORT = url.port;
+  }
+
+  const sslmode = url.searchParams.get('sslmode');
+  if (sslmode) {
+    env.PGSSLMODE = sslmode;
+  }
+
+  return env;
+}
+
+/**
+ * Executes pg_dump to create a gzipped database backup under /tmp.
+ *
+ * Connection details are passed via PG* environment variables instead of
+ * argv, so credentials never show up in `ps` output, and the dump is
+ * streamed stdout -> gzip -> file without buffering the whole database in
+ * memory.
  */
-async function executePgDump(filename: string): Promise<void> {
-  const databaseUrl = process.env.DATABASE_URL as string;
+async function executePgDump(outputPath: string, databaseUrl: string): Promise<void> {
   const sanitizedUrl = sanitizeDatabaseUrl(databaseUrl);
 
-  console.log(`[backup-db] Would run pg_dump for database: ${sanitizedUrl}`);
-  console.log(`[backup-db] Output file: ${filename}`);
+  console.log(`[backup-db] Running pg_dump for database: ${sanitizedUrl}`);
+  console.log(`[backup-db] Output file: ${outputPath}`);
 
-  // TODO: Implement pg_dump invocation using child_process.spawn or spawnSync.
-  // Example (to be refined when enabling backups in production):
-  //
-  // import { spawn } from 'child_process';
-  // import * as fs from 'fs';
-  // import * as zlib from 'zlib';
-  //
-  // const dump = spawn('pg_dump', [
-  //   '--no-owner',
-  //   '--no-acl',
-  //   '--format=plain',
-  //   databaseUrl,
-  // ], { stdio: ['ignore', 'pipe', 'pipe'] });
-  //
-  // const gzip = zlib.createGzip();
-  // const output = fs.createWriteStream(`/tmp/${filename}.gz`);
-  //
-  // dump.stdout.pipe(gzip).pipe(output);
-  //
-  // await new Promise<void>((resolve, reject) => {
-  //   dump.on('close', (code) => {
-  //     if (code === 0) resolve();
-  //     else reject(new Error(`pg_dump exited with code ${code}`));
-  //   });
-  //   dump.on('error', reject);
-  // });
+  // Stream into a .partial file and rename into place only after the dump
+  // finishes cleanly, so a killed/timed-out run never leaves a truncated
+  // file at the final path for the upload step to pick up.
+  const partialPath = `${outputPath}.partial`;
+
+  const dump = spawn('pg_dump', ['--no-owner', '--no-acl', '--format=plain'], {
+    env: { ...process.env, ...pgEnvFromDatabaseUrl(databaseUrl) },
+    stdio: ['ignore', 'pipe', 'inherit'],
+  });
+
+  const gzip = zlib.createGzip();
+  const output = fs.createWriteStream(partialPath);
+
+  dump.stdout.pipe(gzip).pipe(output);
+
+  await new Promise<void>((resolve, reject) => {
+    let exited = false;
+    let flushed = false;
+    const timeout = setTimeout(() => {
+      dump.kill('SIGKILL');
+      reject(new Error(`pg_dump timed out after ${PG_DUMP_TIMEOUT_MS}ms`));
+    }, PG_DUMP_TIMEOUT_MS);
+    const maybeResolve = () => {
+      if (exited && flushed) {
+        clearTimeout(timeout);
+        resolve();
+      }
+    };
+
+    dump.on('error', (err) => {
+      clearTimeout(timeout);
+      reject(err);
+    });
+    output.on('error', (err) => {
+      clearTimeout(timeout);
+      reject(err);
+    });
+    output.on('finish', () => {
+      flushed = true;
+      maybeResolve();
+    });
+    dump.on('close', (code) => {
+      if (code === 0) {
+        exited = true;
+        maybeResolve();
+      } else {
+        clearTimeout(timeout);
+        reject(new Error(`pg_dump exited with code ${code}`));
+      }
+    });
+  });
+
+  fs.renameSync(partialPath, outputPath);
 }
 
 /**
  * Uploads the backup file to S3.
  * TODO: Implement actual S3 upload.
  */
-async function uploadToS3(filename: string, s3Key: string): Promise<void> {
-  const bucket = process.env.S3_BACKUP_BUCKET as string;
-  const region = process.env.AWS_REGION as string;
-
-  console.log(`[backup-db] Would upload backup to s3://${bucket}/${s3Key}`);
-  console.log(`[backup-db] AWS Region: ${region}`);
+async function uploadToS3(outputPath: string, s3Key: string, config: BackupConfig): Promise<void> {
+  console.log(`[backup-db] Would upload backup to s3://${config.s3Bucket}/${s3Key}`);
+  console.log(`[backup-db] AWS Region: ${config.awsRegion}`);
 
   // TODO: Implement S3 upload using @aws-sdk/client-s3 once dependency is added.
   // Example (to be refined when enabling backups in production):
@@ -153,7 +239,7 @@ async function uploadToS3(filename: string, s3Key: string): Promise<void> {
   //   },
   // });
   //
-  // const fileContent = fs.readFileSync(`/tmp/${filename}.gz`);
+  // const fileContent = fs.readFileSync(outputPath);
   //
   // await s3Client.send(new PutObjectCommand({
   //   Bucket: bucket,
@@ -166,7 +252,7 @@ async function uploadToS3(filename: string, s3Key: string): Promise<void> {
   // console.log(`[backup-db] Backup uploaded successfully.`);
   //
   // // Clean up temp file
-  // fs.unlinkSync(`/tmp/${filename}.gz`);
+  // fs.unlinkSync(outputPath);
 }
 
 /**
@@ -176,24 +262,29 @@ async function main(): Promise<void> {
   console.log('[backup-db] Starting database backup...');
   console.log(`[backup-db] Timestamp: ${new Date().toISOString()}`);
 
-  // Step 1: Validate environment
-  validateEnvironment();
+  // Step 1: Validate environment and snapshot the values this run uses
+  const config = loadBackupConfig();
 
-  // Step 2: Generate backup filename and S3 key
-  const filename = generateBackupFilename();
-  const s3Key = generateS3Key(filename);
+  // Step 2: Generate backup filename and S3 key from a single timestamp so
+  // the filename and the backups/YYYY/MM/DD/ prefix can never disagree
+  // (e.g., when the job starts right before midnight UTC).
+  const now = new Date();
+  const filename = generateBackupFilename(now);
+  const s3Key = generateS3Key(filename, now);
+  // Build the on-disk path once; every later step works from the same value.
+  const outputPath = `/tmp/${filename}.gz`;
 
   console.log(`[backup-db] Backup filename: ${filename}`);
   console.log(`[backup-db] S3 key: ${s3Key}`);
 
-  // Step 3: Execute pg_dump (skeleton)
-  await executePgDump(filename);
+  // Step 3: Execute pg_dump
+  await executePgDump(outputPath, config.databaseUrl);
 
   // Step 4: Upload to S3 (skeleton)
-  await uploadToS3(filename, s3Key);
+  await uploadToS3(outputPath, s3Key, config);
 
   // Step 5: Complete
-  console.log('[backup-db] Backup skeleton completed (no actual dump/upload performed).');
+  console.log('[backup-db] Backup completed (dump written; S3 upload still stubbed).');
 }
 
 // Entry point
@@ -1,9 +1,11 @@
 import { Module } from '@nestjs/common';
+import { ShopifyModule } from '../shopify/shopify.module';
 import { SeoScanController } from './seo-scan.controller';
 import { SeoScanService } from './seo-scan.service';
 import { PrismaService } from '../prisma.service';
 
 @Module({
+  imports: [ShopifyModule],
   controllers: [SeoScanController],
   providers: [SeoScanService, PrismaService],
   exports: [SeoScanService],
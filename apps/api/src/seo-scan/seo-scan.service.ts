@@ -2,6 +2,10 @@ import { Injectable, NotFoundException, ForbiddenException } from '@nestjs/commo
 import { PrismaService } from '../prisma.service';
 import { IntegrationType } from '@prisma/client';
 import * as cheerio from 'cheerio';
+import { ShopifyService } from '../shopify/shopify.service';
+
+// Compiled once at module load; matches each run of non-whitespace (a word)
+const WORD_RE = /\S+/g;
 
 export interface ScanResult {
   url: string;
@@ -16,7 +20,16 @@ export interface ScanResult {
 
 @Injectable()
 export class SeoScanService {
-  constructor(private readonly prisma: PrismaService) {}
+  // Caches product handles per shopDomain:productId so repeat scans skip
+  // the Admin API GET. Handles are merchant-editable in the Shopify admin,
+  // so a 404 on a cached handle evicts the entry and refetches; see
+  // scanProductPage.
+  private readonly handleCache = new Map<string, string>();
+
+  constructor(
+    private readonly prisma: PrismaService,
+    private readonly shopifyService: ShopifyService,
+  ) {}
 
   /**
    * Start a SEO scan for a project's domain
@@ -85,9 +98,12 @@ export class SeoScanService {
    * Scan a single page and extract SEO data
    */
   async scanPage(url: string): Promise<ScanResult> {
-    const startTime = Date.now();
+    // Use the monotonic clock for durations; Date.now() can jump with NTP
+    // corrections and skew loadTimeMs (and the SLOW_LOAD_TIME issue with it).
+    const startTime = performance.now();
     let statusCode = 0;
     let html = '';
+    let contentType = '';
 
     try {
       const response = await fetch(url, {
@@ -97,6 +113,7 @@ export class SeoScanService {
         redirect: 'follow',
       });
       statusCode = response.status;
+      contentType = response.headers.get('content-type') ?? '';
       html = await response.text();
     } catch (error) {
       return {
@@ -106,12 +123,33 @@ export class SeoScanService {
         metaDescription: null,
         h1: null,
         wordCount: 0,
-        loadTimeMs: Date.now() - startTime,
+        loadTimeMs: Math.round(performance.now() - startTime),
         issues: ['FETCH_ERROR'],
       };
     }
 
-    const loadTimeMs = Date.now() - startTime;
+    const loadTimeMs = Math.round(performance.now() - startTime);
+
+    // Fast pre-check: only run the HTML parser on HTML responses. A homepage
+    // redirecting to a PDF/image/JSON endpoint would otherwise pay the full
+    // parse cost and come back with misleading MISSING_* issues.
+    if (contentType && !contentType.includes('html')) {
+      const issues = ['NOT_HTML_CONTENT'];
+      if (statusCode >= 400) {
+        issues.push('HTTP_ERROR');
+      }
+      return {
+        url,
+        statusCode,
+        title: null,
+        metaDescription: null,
+        h1: null,
+        wordCount: 0,
+        loadTimeMs,
+        issues,
+      };
+    }
+
     const $ = cheerio.load(html);
 
     // Extract SEO elements
@@ -119,9 +157,9 @@ export class SeoScanService {
     const metaDescription = $('meta[name="description"]').attr('content')?.trim() || null;
     const h1 = $('h1').first().text().trim() || null;
 
-    // Calculate word count (simple: text content divided by average word length)
-    const bodyText = $('body').text().replace(/\s+/g, ' ').trim();
-    const wordCount = bodyText.split(/\s+/).filter(Boolean).length;
+    // Calculate word count in a single pass over the body text
+    // (avoids building an intermediate whitespace-normalized copy)
+    const wordCount = ($('body').text().match(WORD_RE) ?? []).length;
 
     // Build issues array
     const issues: string[] = [];
@@ -243,22 +281,33 @@ export class SeoScanService {
     const shopDomain = shopifyIntegration.externalId;
     const accessToken = shopifyIntegration.accessToken;
 
-    // Fetch the product from Shopify to get its handle
-    const shopifyProduct = await this.fetchShopifyProductHandle(
-      shopDomain,
-      accessToken,
-      product.externalId,
-    );
-
-    if (!shopifyProduct || !shopifyProduct.handle) {
-      throw new NotFoundException('Could not find product handle from Shopify');
-    }
+    // Fetch the product from Shopify to get its handle, consulting the
+    // in-memory cache first so repeat scans skip the Admin API round trip.
+    const handleCacheKey = `${shopDomain}:${product.externalId}`;
+    const cachedHandle = this.handleCache.get(handleCacheKey);
+    let handle =
+      cachedHandle ??
+      (await this.fetchProductHandle(shopDomain, accessToken, product.externalId));
 
     // Build the public product URL
-    const productUrl = `https://${shopDomain}/products/${shopifyProduct.handle}`;
+    let productUrl = `https://${shopDomain}/products/${handle}`;
 
     // Scan the product page
-    const scanResult = await this.scanPage(productUrl);
+    let scanResult = await this.scanPage(productUrl);
+
+    // Merchants can rename a handle in the Shopify admin, which would leave
+    // the cached value pointing at a dead URL forever. Treat a 404 on a
+    // cached handle as a stale entry: evict it, refetch, and rescan once if
+    // the handle actually changed.
+    if (cachedHandle && scanResult.statusCode === 404) {
+      this.handleCache.delete(handleCacheKey);
+      handle = await this.fetchProductHandle(shopDomain, accessToken, product.externalId);
+
+      if (handle !== cachedHandle) {
+        productUrl = `https://${shopDomain}/products/${handle}`;
+        scanResult = await this.scanPage(productUrl);
+      }
+    }
 
     // Store the crawl result
     const crawlResult = await this.prisma.crawlResult.create({
@@ -282,34 +331,25 @@ export class SeoScanService {
   }
 
   /**
-   * Fetch a single product from Shopify to get its handle
+   * Fetch a product's handle from the Shopify Admin API and cache it
+   * per shopDomain:productId.
    */
-  private async fetchShopifyProductHandle(
+  private async fetchProductHandle(
     shopDomain: string,
     accessToken: string,
-    productId: string,
-  ): Promise<{ handle: string } | null> {
-    const url = `https://${shopDomain}/admin/api/2023-10/products/${productId}.json`;
-
-    try {
-      const response = await fetch(url, {
-        method: 'GET',
-        headers: {
-          'X-Shopify-Access-Token': accessToken,
-          'Content-Type': 'application/json',
-        },
-      });
-
-      if (!response.ok) {
-        console.error('Shopify API error fetching product:', await response.text());
-        return null;
-      }
+    externalId: string,
+  ): Promise<string> {
+    const shopifyProduct = await this.shopifyService.fetchShopifyProduct(
+      shopDomain,
+      accessToken,
+      externalId,
+    );
 
-      const data = (await response.json()) as { product: { handle: string } };
-      return data.product || null;
-    } catch (error) {
-      console.error('Error fetching Shopify product:', error);
-      return null;
+    if (!shopifyProduct || !shopifyProduct.handle) {
+      throw new NotFoundException('Could not find product handle from Shopify');
     }
+
+    this.handleCache.set(`${shopDomain}:${externalId}`, shopifyProduct.handle);
+    return shopifyProduct.handle;
   }
 }
@@ -4,6 +4,10 @@ import { PrismaService } from '../prisma.service';
 import { IntegrationType } from '@prisma/client';
 import * as crypto from 'crypto';
 
+// Single source of truth for the Shopify Admin API version; every Admin
+// endpoint URL in the codebase should build from this.
+export const SHOPIFY_API_VERSION = '2023-10';
+
 @Injectable()
 export class ShopifyService {
   private readonly apiKey: string;
@@ -82,7 +86,7 @@ export class ShopifyService {
       code,
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchWithRetry(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(body),
@@ -160,6 +164,33 @@ export class ShopifyService {
     return !!project;
   }
 
+  /**
+   * Fetch with retry for transient Shopify Admin API failures.
+   * Retries 429 and 5xx responses with exponential backoff plus jitter,
+   * honoring Retry-After when Shopify provides it.
+   */
+  private async fetchWithRetry(
+    url: string,
+    init: RequestInit,
+    maxAttempts = 3,
+  ): Promise<Response> {
+    for (let attempt = 1; ; attempt++) {
+      const response = await fetch(url, init);
+
+      const retryable = response.status === 429 || response.status >= 500;
+      if (!retryable || attempt >= maxAttempts) {
+        return response;
+      }
+
+      const retryAfter = Number(response.headers.get('Retry-After'));
+      const backoffMs =
+        retryAfter > 0
+          ? retryAfter * 1000
+          : 500 * 2 ** (attempt - 1) + Math.random() * 250;
+      await new Promise((resolve) => setTimeout(resolve, backoffMs));
+    }
+  }
+
   /**
    * Sync products from Shopify store to local database
    */
@@ -190,15 +221,24 @@ export class ShopifyService {
     let created = 0;
     let updated = 0;
 
-    // Upsert each product
+    // Fetch all existing products for the project once and partition the
+    // synced batch in memory, instead of a findFirst round trip per product.
+    const existingProducts = await this.prisma.product.findMany({
+      where: { projectId },
+      select: { id: true, externalId: true },
+    });
+    const existingByExternalId = new Map(
+      existingProducts.map((p) => [p.externalId, p.id]),
+    );
+
+    // Upsert each product, keeping a bounded number of writes in flight so
+    // a 250-product sync isn't 250 serial round trips (and doesn't flood the
+    // connection pool either).
+    const writeConcurrency = 5;
+    const pendingWrites: Array<() => Promise<unknown>> = [];
+
     for (const product of products) {
       const externalId = String(product.id);
-      const existingProduct = await this.prisma.product.findFirst({
-        where: {
-          projectId,
-          externalId,
-        },
-      });
 
       const productData = {
         title: product.title,
@@ -209,24 +249,35 @@ export class ShopifyService {
         lastSyncedAt: new Date(),
       };
 
-      if (existingProduct) {
-        await this.prisma.product.update({
-          where: { id: existingProduct.id },
-          data: productData,
-        });
+      const existingId = existingByExternalId.get(externalId);
+      if (existingId) {
+        pendingWrites.push(() =>
+          this.prisma.product.update({
+            where: { id: existingId },
+            data: productData,
+          }),
+        );
         updated++;
       } else {
-        await this.prisma.product.create({
-          data: {
-            projectId,
-            externalId,
-            ...productData,
-          },
-        });
+        pendingWrites.push(() =>
+          this.prisma.product.create({
+            data: {
+              projectId,
+              externalId,
+              ...productData,
+            },
+          }),
+        );
         created++;
       }
     }
 
+    for (let i = 0; i < pendingWrites.length; i += writeConcurrency) {
+      await Promise.all(
+        pendingWrites.slice(i, i + writeConcurrency).map((write) => write()),
+      );
+    }
+
     return {
       projectId,
       synced: products.length,
@@ -242,9 +293,11 @@ export class ShopifyService {
     shopDomain: string,
     accessToken: string,
   ): Promise<ShopifyProduct[]> {
-    const url = `https://${shopDomain}/admin/api/2023-10/products.json?limit=50`;
+    // 250 is the Admin API maximum page size; larger pages mean fewer
+    // round trips (and fewer rate-limited calls) per sync.
+    const url = `https://${shopDomain}/admin/api/${SHOPIFY_API_VERSION}/products.json?limit=250`;
 
-    const response = await fetch(url, {
+    const response = await this.fetchWithRetry(url, {
       method: 'GET',
       headers: {
         'X-Shopify-Access-Token': accessToken,
@@ -270,9 +323,9 @@ export class ShopifyService {
     accessToken: string,
     productId: string,
   ): Promise<ShopifyProduct | null> {
-    const url = `https://${shopDomain}/admin/api/2023-10/products/${productId}.json`;
+    const url = `https://${shopDomain}/admin/api/${SHOPIFY_API_VERSION}/products/${productId}.json`;
 
-    const response = await fetch(url, {
+    const response = await this.fetchWithRetry(url, {
       method: 'GET',
       headers: {
         'X-Shopify-Access-Token': accessToken,
@@ -329,6 +382,17 @@ export class ShopifyService {
     const shopDomain = integration.externalId;
     const accessToken = integration.accessToken;
 
+    // No-op apply: the stored values already match, so skip the Shopify
+    // round trip and the local write entirely.
+    if (product.seoTitle === seoTitle && product.seoDescription === seoDescription) {
+      return {
+        productId,
+        shopDomain,
+        seoTitle,
+        seoDescription,
+      };
+    }
+
     // Update SEO in Shopify using metafields
     await this.updateShopifyProductSeo(
       shopDomain,
@@ -368,7 +432,7 @@ export class ShopifyService {
     seoDescription: string,
   ): Promise<void> {
     // Shopify REST API endpoint for updating a product
-    const url = `https://${shopDomain}/admin/api/2023-10/products/${externalProductId}.json`;
+    const url = `https://${shopDomain}/admin/api/${SHOPIFY_API_VERSION}/products/${externalProductId}.json`;
 
     // Update product with metafields_global_title_tag and metafields_global_description_tag
     // These are Shopify's built-in SEO fields that appear in the product admin
@@ -380,7 +444,7 @@ export class ShopifyService {
       },
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchWithRetry(url, {
       method: 'PUT',
       headers: {
         'X-Shopify-Access-Token': accessToken,
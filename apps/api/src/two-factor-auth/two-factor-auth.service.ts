@@ -1,7 +1,6 @@
 import { Injectable, BadRequestException } from '@nestjs/common';
 import { PrismaService } from '../prisma.service';
 import * as speakeasy from 'speakeasy';
-import * as QRCode from 'qrcode';
 
 export interface TwoFactorSetupResponse {
   otpauthUrl: string;
@@ -41,7 +40,10 @@ export class TwoFactorAuthService {
       },
     });
 
-    // Generate QR code as data URL
+    // Generate QR code as data URL. qrcode is only needed for this
+    // one-time setup flow, so load it lazily instead of at boot; Node
+    // caches the module after the first call.
+    const QRCode = await import('qrcode');
     const otpauthUrl = secret.otpauth_url!;
     const qrCodeDataUrl = await QRCode.toDataURL(otpauthUrl);
 
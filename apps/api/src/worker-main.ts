@@ -7,7 +7,20 @@ async function bootstrap() {
 
   // Keep process alive; Render/PM2 will manage lifecycle.
   // Optionally handle graceful shutdown.
+  let shuttingDown = false;
   const shutdown = async () => {
+    if (shuttingDown) return;
+    shuttingDown = true;
+
+    // Force-exit watchdog: if a worker (or its Redis connection) refuses to
+    // close, don't leave an orphaned process behind for the supervisor.
+    const forceExit = setTimeout(() => {
+      // eslint-disable-next-line no-console
+      console.error('Graceful shutdown timed out after 10s, forcing exit.');
+      process.exit(1);
+    }, 10_000);
+    forceExit.unref();
+
     await appContext.close();
     process.exit(0);
   };
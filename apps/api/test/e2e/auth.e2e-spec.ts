@@ -1,7 +1,7 @@
 import { INestApplication } from '@nestjs/common';
 import request from 'supertest';
 import { createTestApp } from '../utils/test-app';
-import { cleanupTestDb, disconnectTestDb } from '../utils/test-db';
+import { registerDbLifecycle, TEST_PASSWORD } from '../utils/test-helpers';
 
 describe('Auth (e2e)', () => {
   let app: INestApplication;
@@ -13,27 +13,31 @@ describe('Auth (e2e)', () => {
   });
 
   afterAll(async () => {
-    await cleanupTestDb();
-    await disconnectTestDb();
     await app.close();
   });
 
-  beforeEach(async () => {
-    await cleanupTestDb();
-  });
+  registerDbLifecycle();
 
   const email = 'test-auth@example.com';
-  const password = 'testpassword123';
+  const password = TEST_PASSWORD;
+
+  // Shared request payloads, built once instead of per test
+  const signupPayload = {
+    email,
+    password,
+    name: 'Test User',
+    captchaToken: 'test-token',
+  };
+  const loginPayload = {
+    email,
+    password,
+    captchaToken: 'test-token',
+  };
 
   it('signup returns user without password', async () => {
     const res = await request(server)
       .post('/auth/signup')
-      .send({
-        email,
-        password,
-        name: 'Test User',
-        captchaToken: 'test-token',
-      });
+      .send(signupPayload);
 
     expect(res.status).toBe(201);
     expect(res.body).toHaveProperty('id');
@@ -41,80 +45,53 @@ describe('Auth (e2e)', () => {
     expect(res.body).not.toHaveProperty('password');
   });
 
-  it('login returns access token after signup', async () => {
-    await request(server)
-      .post('/auth/signup')
-      .send({
-        email,
-        password,
-        name: 'Test User',
-        captchaToken: 'test-token',
-      })
-      .expect(201);
-
-    const res = await request(server)
-      .post('/auth/login')
-      .send({
-        email,
-        password,
-        captchaToken: 'test-token',
-      });
-
-    expect(res.status).toBe(200);
-    expect(res.body).toHaveProperty('accessToken');
-  });
-
-  it('/users/me returns current user for valid token', async () => {
-    await request(server)
-      .post('/auth/signup')
-      .send({
-        email,
-        password,
-        name: 'Test User',
-        captchaToken: 'test-token',
-      })
-      .expect(201);
-
-    const loginRes = await request(server)
-      .post('/auth/login')
-      .send({
-        email,
-        password,
-        captchaToken: 'test-token',
-      })
-      .expect(200);
-
-    const token = loginRes.body.accessToken as string;
-    expect(token).toBeDefined();
-
-    const meRes = await request(server)
-      .get('/users/me')
-      .set('Authorization', `Bearer ${token}`);
-
-    expect(meRes.status).toBe(200);
-    expect(meRes.body).toHaveProperty('email', email);
-  });
-
-  it('invalid login returns 401', async () => {
-    await request(server)
-      .post('/auth/signup')
-      .send({
-        email,
-        password,
-        name: 'Test User',
-        captchaToken: 'test-token',
-      })
-      .expect(201);
-
-    const res = await request(server)
-      .post('/auth/login')
-      .send({
-        email,
-        password: 'wrong-password',
-        captchaToken: 'test-token',
-      });
-
-    expect(res.status).toBe(401);
+  describe('with an existing account', () => {
+    // Runs after the DB cleanup hook, so each test starts from the same
+    // freshly signed-up account instead of repeating the preamble inline.
+    beforeEach(async () => {
+      await request(server)
+        .post('/auth/signup')
+        .send(signupPayload)
+        .expect(201);
+    });
+
+    it('login returns access token after signup', async () => {
+      const res = await request(server)
+        .post('/auth/login')
+        .send(loginPayload);
+
+      expect(res.status).toBe(200);
+      expect(res.body).toHaveProperty('accessToken');
+    });
+
+    it('/users/me returns current user for valid token', async () => {
+      const loginRes = await request(server)
+        .post('/auth/login')
+        .send(loginPayload)
+        .expect(200);
+
+      const token = loginRes.body.accessToken as string;
+      expect(token).toBeDefined();
+
+      const meRes = await request(server)
+        .get('/users/me')
+        .set('Authorization', `Bearer ${token}`);
+
+      expect(meRes.status).toBe(200);
+      expect(meRes.body).toHaveProperty('email', email);
+    });
+
+    it('invalid login returns 401', async () => {
+      const res = await request(server)
+        .post('/auth/login')
+        .send({
+          email,
+          password: 'wrong-password',
+          captchaToken: 'test-token',
+        });
+
+      expect(res.status).toBe(401);
+    });
   });
 
   it('protected endpoint requires a token', async () => {
@@ -1,85 +1,46 @@
 import { INestApplication } from '@nestjs/common';
 import request from 'supertest';
 import { createTestApp } from '../utils/test-app';
-import { cleanupTestDb, disconnectTestDb } from '../utils/test-db';
+import {
+  signupAndLogin,
+  createProject,
+  registerDbLifecycle,
+  TEST_PASSWORD,
+} from '../utils/test-helpers';
 import { DeoScoreService, DeoSignalsService } from '../../src/projects/deo-score.service';
 
-async function signupAndLogin(
-  server: any,
-  email: string,
-  password: string,
-): Promise<{ token: string; userId: string }> {
-  await request(server)
-    .post('/auth/signup')
-    .send({
-      email,
-      password,
-      name: 'Test User',
-      captchaToken: 'test-token',
-    })
-    .expect(201);
-
-  const loginRes = await request(server)
-    .post('/auth/login')
-    .send({
-      email,
-      password,
-      captchaToken: 'test-token',
-    })
-    .expect(200);
-
-  return {
-    token: loginRes.body.accessToken as string,
-    userId: loginRes.body.user.id as string,
-  };
-}
-
-async function createProject(
-  server: any,
-  token: string,
-  name = 'DEO Project',
-): Promise<string> {
-  const res = await request(server)
-    .post('/projects')
-    .set('Authorization', `Bearer ${token}`)
-    .send({
-      name,
-      domain: 'deo-project.example.com',
-    })
-    .expect(201);
-
-  return res.body.id as string;
-}
-
 describe('DEO Score (e2e)', () => {
   let app: INestApplication;
   let server: any;
+  let deoSignalsService: DeoSignalsService;
+  let deoScoreService: DeoScoreService;
 
   beforeAll(async () => {
     app = await createTestApp();
     server = app.getHttpServer();
+    // Resolve once; provider lookups don't need to run inside the test
+    deoSignalsService = app.get(DeoSignalsService);
+    deoScoreService = app.get(DeoScoreService);
   });
 
   afterAll(async () => {
-    await cleanupTestDb();
-    await disconnectTestDb();
     await app.close();
   });
 
-  beforeEach(async () => {
-    await cleanupTestDb();
-  });
+  registerDbLifecycle();
 
   it('recompute enqueues job and scoring pipeline persists snapshot', async () => {
     const { token } = await signupAndLogin(
       server,
       'deo-score-owner@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
     const projectId = await createProject(server, token, 'DEO Score Project');
+    // Derived once; both the recompute POST and the follow-up GET share it
+    const deoScoreUrl = `/projects/${projectId}/deo-score`;
 
     const recomputeRes = await request(server)
-      .post(`/projects/${projectId}/deo-score/recompute`)
+      .post(`${deoScoreUrl}/recompute`)
       .set('Authorization', `Bearer ${token}`)
       .send();
 
@@ -90,9 +51,6 @@ describe('DEO Score (e2e)', () => {
     });
 
     // Simulate worker execution synchronously in tests
-    const deoSignalsService = app.get(DeoSignalsService);
-    const deoScoreService = app.get(DeoScoreService);
-
     const signals = await deoSignalsService.collectSignalsForProject(projectId);
     const snapshot = await deoScoreService.computeAndPersistScoreFromSignals(
       projectId,
@@ -104,7 +62,7 @@ describe('DEO Score (e2e)', () => {
     expect(snapshot.breakdown.overall).toBeLessThanOrEqual(100);
 
     const getRes = await request(server)
-      .get(`/projects/${projectId}/deo-score`)
+      .get(deoScoreUrl)
       .set('Authorization', `Bearer ${token}`)
       .send();
 
@@ -122,12 +80,12 @@ describe('DEO Score (e2e)', () => {
     const owner = await signupAndLogin(
       server,
       'deo-owner@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
     const other = await signupAndLogin(
       server,
       'deo-other@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     const projectId = await createProject(server, owner.token, 'Owner Project');
@@ -144,7 +102,7 @@ describe('DEO Score (e2e)', () => {
     const { token } = await signupAndLogin(
       server,
       'deo-invalid@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     const res = await request(server)
@@ -4,9 +4,11 @@ import { createTestApp } from '../utils/test-app';
 
 describe('Health (e2e)', () => {
   let app: INestApplication;
+  let server: any;
 
   beforeAll(async () => {
     app = await createTestApp();
+    server = app.getHttpServer();
   });
 
   afterAll(async () => {
@@ -14,7 +16,7 @@ describe('Health (e2e)', () => {
   });
 
   it('GET /health returns ok', async () => {
-    const res = await request(app.getHttpServer()).get('/health').expect(200);
+    const res = await request(server).get('/health').expect(200);
     expect(res.body).toEqual({ status: 'ok' });
   });
 });
@@ -1,37 +1,11 @@
 import { INestApplication } from '@nestjs/common';
 import request from 'supertest';
 import { createTestApp } from '../utils/test-app';
-import { cleanupTestDb, disconnectTestDb } from '../utils/test-db';
-
-async function signupAndLogin(
-  server: any,
-  email: string,
-  password: string,
-): Promise<{ token: string; userId: string }> {
-  await request(server)
-    .post('/auth/signup')
-    .send({
-      email,
-      password,
-      name: 'Test User',
-      captchaToken: 'test-token',
-    })
-    .expect(201);
-
-  const loginRes = await request(server)
-    .post('/auth/login')
-    .send({
-      email,
-      password,
-      captchaToken: 'test-token',
-    })
-    .expect(200);
-
-  return {
-    token: loginRes.body.accessToken as string,
-    userId: loginRes.body.user.id as string,
-  };
-}
+import {
+  signupAndLogin,
+  registerDbLifecycle,
+  TEST_PASSWORD,
+} from '../utils/test-helpers';
 
 describe('Projects (e2e)', () => {
   let app: INestApplication;
@@ -43,20 +17,16 @@ describe('Projects (e2e)', () => {
   });
 
   afterAll(async () => {
-    await cleanupTestDb();
-    await disconnectTestDb();
     await app.close();
   });
 
-  beforeEach(async () => {
-    await cleanupTestDb();
-  });
+  registerDbLifecycle();
 
   it('POST /projects creates a project', async () => {
     const { token } = await signupAndLogin(
       server,
       'proj-create@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     const res = await request(server)
@@ -76,12 +46,12 @@ describe('Projects (e2e)', () => {
     const user1 = await signupAndLogin(
       server,
       'user1-projects@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
     const user2 = await signupAndLogin(
       server,
       'user2-projects@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     // Create two projects for user1
@@ -120,12 +90,12 @@ describe('Projects (e2e)', () => {
     const user1 = await signupAndLogin(
       server,
       'owner-project@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
     const user2 = await signupAndLogin(
       server,
       'other-project@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     const createRes = await request(server)
@@ -143,17 +113,20 @@ describe('Projects (e2e)', () => {
     expect(res.status).toBe(403);
   });
 
-  it('invalid payload results in an error response', async () => {
+  it.each([
+    ['empty body', {}],
+    ['domain without name', { domain: 'invalid.example.com' }],
+  ])('invalid payload (%s) results in an error response', async (_label, payload) => {
     const { token } = await signupAndLogin(
       server,
       'invalid-project@example.com',
-      'testpassword123',
+      TEST_PASSWORD,
     );
 
     const res = await request(server)
       .post('/projects')
       .set('Authorization', `Bearer ${token}`)
-      .send({}); // missing required name
+      .send(payload); // missing required name
 
     expect(res.status).toBeGreaterThanOrEqual(400);
   });
@@ -1,15 +1,34 @@
 import { testPrisma } from '../utils/test-db';
+import { TEST_PASSWORD } from '../utils/test-helpers';
 import * as bcrypt from 'bcrypt';
 
+// bcrypt with 10 rounds is deliberately slow (~100ms). Hash the default
+// password once and reuse it; only overridden passwords pay per call.
+let defaultPasswordHash: string | undefined;
+
+// Monotonic counter for generated emails; Date.now() alone can collide
+// when two users are created within the same millisecond.
+let userCounter = 0;
+
+async function hashPassword(password: string): Promise<string> {
+  if (password !== TEST_PASSWORD) {
+    return bcrypt.hash(password, 10);
+  }
+  if (!defaultPasswordHash) {
+    defaultPasswordHash = await bcrypt.hash(password, 10);
+  }
+  return defaultPasswordHash;
+}
+
 export async function createTestUser(
   overrides: Partial<{ email: string; password: string; name: string }> = {},
 ) {
-  const password = overrides.password ?? 'testpassword123';
-  const hashedPassword = await bcrypt.hash(password, 10);
+  const password = overrides.password ?? TEST_PASSWORD;
+  const hashedPassword = await hashPassword(password);
 
   const user = await testPrisma.user.create({
     data: {
-      email: overrides.email ?? `test-${Date.now()}@example.com`,
+      email: overrides.email ?? `test-${++userCounter}-${Date.now()}@example.com`,
       password: hashedPassword,
       name: overrides.name ?? 'Test User',
     },
@@ -18,6 +37,13 @@ export async function createTestUser(
   return { user, rawPassword: password };
 }
 
+// Template shared by every created project; per-call overrides are
+// spread on top rather than re-stating the defaults field by field.
+const PROJECT_DEFAULTS = Object.freeze({
+  name: 'Test Project',
+  domain: null as string | null,
+});
+
 export async function createTestProject(
   userId: string,
   overrides: Partial<{ name: string; domain: string }> = {},
@@ -25,8 +51,8 @@ export async function createTestProject(
   return testPrisma.project.create({
     data: {
       userId,
-      name: overrides.name ?? 'Test Project',
-      domain: overrides.domain ?? null,
+      ...PROJECT_DEFAULTS,
+      ...overrides,
     },
   });
 }
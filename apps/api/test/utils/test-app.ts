@@ -3,21 +3,23 @@ import { INestApplication, ValidationPipe } from '@nestjs/common';
 import { AppModule } from '../../src/app.module';
 import { CaptchaService } from '../../src/captcha/captcha.service';
 
-class CaptchaServiceStub {
+// Plain value stub: the tests only need the verify method, so there is no
+// reason to have Nest instantiate a class per testing module.
+const captchaServiceStub = {
   async verify(token: string): Promise<boolean> {
     if (!token) {
       throw new Error('CAPTCHA token is required in tests');
     }
     return true;
-  }
-}
+  },
+};
 
 export async function createTestApp(): Promise<INestApplication> {
   const moduleFixture: TestingModule = await Test.createTestingModule({
     imports: [AppModule],
   })
     .overrideProvider(CaptchaService)
-    .useClass(CaptchaServiceStub)
+    .useValue(captchaServiceStub)
     .compile();
 
   const app = moduleFixture.createNestApplication();
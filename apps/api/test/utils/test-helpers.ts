@@ -0,0 +1,77 @@
+import request from 'supertest';
+import { cleanupTestDb, disconnectTestDb } from './test-db';
+
+/**
+ * Shared e2e helpers for flows that go through the public API
+ * (as opposed to the direct-DB fixtures in ../fixtures/test-data).
+ */
+
+/**
+ * Canonical password for test accounts, shared by every suite and by the
+ * direct-DB fixtures (which cache its bcrypt hash).
+ */
+export const TEST_PASSWORD = 'testpassword123';
+
+/**
+ * Installs the DB lifecycle hooks every DB-backed suite repeats: a clean
+ * database before each test, and a disconnect after the suite. Call inside
+ * the top-level describe, before the suite's own hooks.
+ *
+ * No cleanup runs in afterAll: every test (including the first of the next
+ * suite) is already preceded by a beforeEach clean, so a trailing truncate
+ * would only redo work.
+ */
+export function registerDbLifecycle(): void {
+  beforeEach(async () => {
+    await cleanupTestDb();
+  });
+
+  afterAll(async () => {
+    await disconnectTestDb();
+  });
+}
+
+export async function signupAndLogin(
+  server: any,
+  email: string,
+  password: string,
+): Promise<{ token: string; userId: string }> {
+  await request(server)
+    .post('/auth/signup')
+    .send({
+      email,
+      password,
+      name: 'Test User',
+      captchaToken: 'test-token',
+    })
+    .expect(201);
+
+  const loginRes = await request(server)
+    .post('/auth/login')
+    .send({
+      email,
+      password,
+      captchaToken: 'test-token',
+    })
+    .expect(200);
+
+  return {
+    token: loginRes.body.accessToken as string,
+    userId: loginRes.body.user.id as string,
+  };
+}
+
+export async function createProject(
+  server: any,
+  token: string,
+  name = 'Test Project',
+  domain = 'test-project.example.com',
+): Promise<string> {
+  const res = await request(server)
+    .post('/projects')
+    .set('Authorization', `Bearer ${token}`)
+    .send({ name, domain })
+    .expect(201);
+
+  return res.body.id as string;
+}
@@ -8,6 +8,9 @@ import { setToken } from '@/lib/auth';
 // Session storage key for 2FA temp token (must match login page)
 const TEMP_2FA_TOKEN_KEY = 'engineo_temp_2fa_token';
 
+// Strips non-digits from TOTP input; compiled once, not per keystroke
+const NON_DIGIT_RE = /\D/g;
+
 export default function TwoFactorPage() {
   const router = useRouter();
   const [code, setCode] = useState('');
@@ -107,7 +110,7 @@ export default function TwoFactorPage() {
               autoComplete="one-time-code"
               required
               value={code}
-              onChange={(e) => setCode(e.target.value.replace(/\D/g, '').slice(0, 6))}
+              onChange={(e) => setCode(e.target.value.replace(NON_DIGIT_RE, '').slice(0, 6))}
               className="block w-full px-4 py-4 border border-gray-300 rounded-md shadow-sm placeholder-gray-400 focus:outline-none focus:ring-blue-500 focus:border-blue-500 text-center text-3xl tracking-[0.5em] font-mono"
               placeholder="000000"
               maxLength={6}
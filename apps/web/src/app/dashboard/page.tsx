@@ -88,16 +88,21 @@ export default function DashboardPage() {
     fetchData();
   }, [router]);
 
-  // Calculate aggregate stats
+  // Calculate aggregate stats in one pass over the overviews
   const totalProjects = projects.length;
-  const projectsWithScans = Object.values(overviews).filter(o => o.crawlCount > 0).length;
-  const avgSeoScore = (() => {
-    const scoresWithData = Object.values(overviews)
-      .filter(o => o.avgSeoScore !== null)
-      .map(o => o.avgSeoScore as number);
-    if (scoresWithData.length === 0) return null;
-    return Math.round(scoresWithData.reduce((a, b) => a + b, 0) / scoresWithData.length);
-  })();
+  let projectsWithScans = 0;
+  let scoreSum = 0;
+  let scoreCount = 0;
+  for (const o of Object.values(overviews)) {
+    if (o.crawlCount > 0) {
+      projectsWithScans++;
+    }
+    if (o.avgSeoScore !== null) {
+      scoreSum += o.avgSeoScore;
+      scoreCount++;
+    }
+  }
+  const avgSeoScore = scoreCount > 0 ? Math.round(scoreSum / scoreCount) : null;
 
   const getScoreColor = (score: number | null) => {
     if (score === null) return 'text-gray-400';
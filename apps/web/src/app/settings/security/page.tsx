@@ -6,6 +6,9 @@ import Link from 'next/link';
 import { usersApi, twoFactorApi } from '@/lib/api';
 import { isAuthenticated } from '@/lib/auth';
 
+// Strips non-digits from TOTP input; compiled once, not per keystroke
+const NON_DIGIT_RE = /\D/g;
+
 interface User {
   id: string;
   email: string;
@@ -200,7 +203,7 @@ export default function SecuritySettingsPage() {
                 type="text"
                 id="code"
                 value={verificationCode}
-                onChange={(e) => setVerificationCode(e.target.value.replace(/\D/g, '').slice(0, 6))}
+                onChange={(e) => setVerificationCode(e.target.value.replace(NON_DIGIT_RE, '').slice(0, 6))}
                 placeholder="000000"
                 maxLength={6}
                 pattern="[0-9]{6}"
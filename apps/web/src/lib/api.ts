@@ -58,6 +58,19 @@ function getStatusMessage(status: number, statusText: string): string {
   return statusText || 'Request failed. Please try again.';
 }
 
+/**
+ * Decode a response exactly once: error bodies feed buildApiError, success
+ * bodies are returned parsed.
+ */
+async function handleResponse(response: Response) {
+  if (!response.ok) {
+    const body = await response.json().catch(() => null);
+    throw buildApiError(response, body);
+  }
+
+  return response.json();
+}
+
 async function fetchWithAuth(endpoint: string, options: RequestInit = {}) {
   const token = getToken();
   const headers: HeadersInit = {
@@ -74,12 +87,7 @@ async function fetchWithAuth(endpoint: string, options: RequestInit = {}) {
     headers,
   });
 
-  if (!response.ok) {
-    const body = await response.json().catch(() => null);
-    throw buildApiError(response, body);
-  }
-
-  return response.json();
+  return handleResponse(response);
 }
 
 /**
@@ -97,12 +105,7 @@ async function fetchWithoutAuth(endpoint: string, options: RequestInit = {}) {
     headers,
   });
 
-  if (!response.ok) {
-    const body = await response.json().catch(() => null);
-    throw buildApiError(response, body);
-  }
-
-  return response.json();
+  return handleResponse(response);
 }
 
 export const authApi = {
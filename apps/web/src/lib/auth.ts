@@ -1,18 +1,28 @@
 const TOKEN_KEY = 'engineo_token';
 
+// In-memory mirror of the stored token. getToken runs on every API call,
+// and all writes in this app go through setToken/removeToken below, so the
+// mirror stays consistent and repeat reads skip the localStorage engine.
+let cachedToken: string | null = null;
+
 export function getToken(): string | null {
   if (typeof window === 'undefined') return null;
-  return localStorage.getItem(TOKEN_KEY);
+  if (cachedToken === null) {
+    cachedToken = localStorage.getItem(TOKEN_KEY);
+  }
+  return cachedToken;
 }
 
 export function setToken(token: string): void {
   if (typeof window === 'undefined') return;
   localStorage.setItem(TOKEN_KEY, token);
+  cachedToken = token;
 }
 
 export function removeToken(): void {
   if (typeof window === 'undefined') return;
   localStorage.removeItem(TOKEN_KEY);
+  cachedToken = null;
 }
 
 export function isAuthenticated(): boolean {
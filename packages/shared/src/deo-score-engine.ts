@@ -19,10 +19,18 @@ function normalize01To100(value: number | null | undefined): number {
  * Returns null if no usable values.
  */
 function averageNullable(values: Array<number | null | undefined>): number | null {
-  const valid = values.filter((v): v is number => v != null && !Number.isNaN(v));
-  if (valid.length === 0) return null;
-  const sum = valid.reduce((acc, v) => acc + v, 0);
-  return sum / valid.length;
+  // Single pass: summing while filtering avoids materializing the
+  // intermediate array a filter-then-reduce chain would allocate.
+  let sum = 0;
+  let count = 0;
+  for (const v of values) {
+    if (v != null && !Number.isNaN(v)) {
+      sum += v;
+      count += 1;
+    }
+  }
+  if (count === 0) return null;
+  return sum / count;
 }
 
 /**